@@ -4,13 +4,16 @@ Trie-Based Algorithms
 Algorithms using Trie (Prefix Tree) data structure.
 """
 
+from collections import deque
+
 
 class TrieNode:
     """Node in a Trie."""
+    __slots__ = ('children', 'is_end_of_word')
+
     def __init__(self):
         self.children = {}
         self.is_end_of_word = False
-        self.word = None  # Store complete word at end node
 
 
 class Autocomplete:
@@ -30,12 +33,13 @@ class Autocomplete:
         node = self.root
 
         for char in word:
-            if char not in node.children:
-                node.children[char] = TrieNode()
-            node = node.children[char]
+            child = node.children.get(char)
+            if child is None:
+                child = TrieNode()
+                node.children[char] = child
+            node = child
 
         node.is_end_of_word = True
-        node.word = word
 
     def search(self, word):
         """
@@ -45,9 +49,9 @@ class Autocomplete:
         node = self.root
 
         for char in word:
-            if char not in node.children:
+            node = node.children.get(char)
+            if node is None:
                 return False
-            node = node.children[char]
 
         return node.is_end_of_word
 
@@ -59,9 +63,9 @@ class Autocomplete:
         node = self.root
 
         for char in prefix:
-            if char not in node.children:
+            node = node.children.get(char)
+            if node is None:
                 return False
-            node = node.children[char]
 
         return True
 
@@ -81,22 +85,26 @@ class Autocomplete:
 
         # Navigate to prefix node
         for char in prefix:
-            if char not in node.children:
+            node = node.children.get(char)
+            if node is None:
                 return []
-            node = node.children[char]
 
-        # DFS to find all words with this prefix
+        # DFS to find all words with this prefix, rebuilding each word
+        # from the characters on the path instead of storing it on the node
         suggestions = []
+        path = list(prefix)
 
         def dfs(current_node):
             if len(suggestions) >= max_suggestions:
                 return
 
             if current_node.is_end_of_word:
-                suggestions.append(current_node.word)
+                suggestions.append(''.join(path))
 
-            for child in current_node.children.values():
+            for char, child in current_node.children.items():
+                path.append(char)
                 dfs(child)
+                path.pop()
 
         dfs(node)
         return suggestions
@@ -104,14 +112,221 @@ class Autocomplete:
     def get_all_words(self):
         """Get all words in trie."""
         words = []
+        path = []
+        stack = [(self.root, 0, '')]
+
+        # Iterative DFS over one shared character buffer: each entry cuts
+        # path back to its depth and appends its own character. Children
+        # are pushed in reverse to keep their order.
+        while stack:
+            node, depth, char = stack.pop()
+            path[depth:] = char
 
-        def dfs(node):
             if node.is_end_of_word:
-                words.append(node.word)
+                words.append(''.join(path))
+
+            depth = len(path)
+            for char, child in reversed(node.children.items()):
+                stack.append((child, depth, char))
+
+        return words
+
+    def compact(self):
+        """
+        Rebuild the trie level by level (BFS order).
+        Nodes on the same level are allocated next to each other, so later
+        DFS walks (get_suggestions, get_all_words) sweep memory roughly
+        front to back. Call once after all inserts.
+        Time: O(N) where N is total nodes
+        """
+        new_root = TrieNode()
+        queue = deque([(self.root, new_root)])
+
+        while queue:
+            old_node, new_node = queue.popleft()
+            new_node.is_end_of_word = old_node.is_end_of_word
+
+            for char, child in old_node.children.items():
+                new_child = TrieNode()
+                new_node.children[char] = new_child
+                queue.append((child, new_child))
+
+        self.root = new_root
+
+
+class PathNode:
+    """Heavy path in a path-decomposed trie."""
+    __slots__ = ('label', 'ends', 'branches')
+
+    def __init__(self, label):
+        self.label = label  # Characters along the heavy path
+        self.ends = set()  # Offsets into label where a word ends
+        self.branches = {}  # Offset -> {first char: light subtree}
+
+
+class CompactAutocomplete:
+    """
+    Read-only autocomplete using a centroid path-decomposed trie.
+    Each node stores a whole heavy path (the child with the most words)
+    as one string, and light edges lead to subtrees with at most half the
+    words, so the structure needs far fewer node objects than a
+    character-per-node trie. Lookups are not faster than Autocomplete.
+    Build it once from the complete word list.
+    """
+
+    def __init__(self, words):
+        trie = Autocomplete()
+        for word in words:
+            trie.insert(word)
+
+        self.root = self._decompose(trie.root, "", self._count_words(trie.root))
+
+    def _count_words(self, root):
+        """Map id(node) -> number of words in that node's subtree."""
+        order = []
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            order.append(node)
+            stack.extend(node.children.values())
+
+        counts = {}
+        for node in reversed(order):
+            total = 1 if node.is_end_of_word else 0
             for child in node.children.values():
-                dfs(child)
+                total += counts[id(child)]
+            counts[id(node)] = total
+
+        return counts
+
+    def _decompose(self, node, first_char, counts):
+        """Turn the subtree under node into a PathNode tree."""
+        chars = [first_char] if first_char else []
+        ends = set()
+        light = []
+
+        # Follow the heavy child down to a leaf
+        while True:
+            offset = len(chars)
+            if node.is_end_of_word:
+                ends.add(offset)
+            if not node.children:
+                break
+
+            heavy = max(node.children, key=lambda c: counts[id(node.children[c])])
+            for char, child in node.children.items():
+                if char != heavy:
+                    light.append((offset, char, child))
+
+            chars.append(heavy)
+            node = node.children[heavy]
+
+        path = PathNode(''.join(chars))
+        path.ends = ends
+
+        for offset, char, child in light:
+            path.branches.setdefault(offset, {})[char] = self._decompose(child, char, counts)
+
+        return path
+
+    def _locate(self, prefix):
+        """
+        Walk to the point where prefix ends.
+
+        Returns:
+            (path, start, offset) with path.label[:offset] == prefix[start:],
+            or None if no word starts with prefix
+        """
+        path = self.root
+        start = 0
+        n = len(prefix)
+        known = 0  # Leading label characters already known to match
+
+        while True:
+            label = path.label
+            remaining = n - start
+
+            # A label the prefix fully covers, or ends inside, is settled by
+            # one startswith compare
+            if remaining >= len(label) and prefix.startswith(label, start):
+                if remaining == len(label):
+                    return path, start, remaining
+                matched = len(label)
+            elif remaining < len(label) and label.startswith(prefix[start:]):
+                # prefix ends partway along this label
+                return path, start, remaining
+            else:
+                # prefix leaves the label at its first differing character,
+                # which the checks above guarantee exists
+                matched = known
+                while label[matched] == prefix[start + matched]:
+                    matched += 1
+
+            branch = path.branches.get(matched)
+            if branch is None:
+                return None
+            start += matched
+            path = branch.get(prefix[start])
+            if path is None:
+                return None
+            # A light subtree's label starts with the character just used
+            known = 1
+
+    def _collect(self, path, base, offset, words, limit):
+        """Collect words below label[:offset] of path, prefixed by base."""
+        label = path.label
+
+        for i in range(offset, len(label) + 1):
+            if len(words) >= limit:
+                return
+
+            if i in path.ends:
+                words.append(base + label[:i])
+
+            for child in path.branches.get(i, {}).values():
+                if len(words) >= limit:
+                    return
+                self._collect(child, base + label[:i], 0, words, limit)
+
+    def search(self, word):
+        """
+        Search for exact word.
+        Time: O(M)
+        """
+        location = self._locate(word)
+        return location is not None and location[2] in location[0].ends
+
+    def starts_with(self, prefix):
+        """
+        Check if any word starts with prefix.
+        Time: O(M)
+        """
+        return self._locate(prefix) is not None
+
+    def get_suggestions(self, prefix, max_suggestions=10):
+        """
+        Get word suggestions for a prefix.
+
+        Args:
+            prefix: Prefix string
+            max_suggestions: Maximum number of suggestions
+
+        Returns:
+            List of suggested words
+        """
+        location = self._locate(prefix)
+        if location is None:
+            return []
+
+        path, start, offset = location
+        suggestions = []
+        self._collect(path, prefix[:start], offset, suggestions, max_suggestions)
+        return suggestions
 
-        dfs(self.root)
+    def get_all_words(self):
+        """Get all words in trie."""
+        words = []
+        self._collect(self.root, "", 0, words, float('inf'))
         return words
 
 
@@ -129,9 +344,11 @@ class WordDictionary:
         node = self.root
 
         for char in word:
-            if char not in node.children:
-                node.children[char] = TrieNode()
-            node = node.children[char]
+            child = node.children.get(char)
+            if child is None:
+                child = TrieNode()
+                node.children[char] = child
+            node = child
 
         node.is_end_of_word = True
 
@@ -153,13 +370,37 @@ class WordDictionary:
                         return True
                 return False
             else:
-                if char not in node.children:
+                child = node.children.get(char)
+                if child is None:
                     return False
-                return dfs(node.children[char], i + 1)
+                return dfs(child, i + 1)
 
         return dfs(self.root, 0)
 
 
+def _build_trie(words):
+    """
+    Build a trie from a list of words.
+
+    Args:
+        words: Words to insert
+
+    Returns:
+        Root TrieNode
+    """
+    root = TrieNode()
+    for word in words:
+        node = root
+        for char in word:
+            child = node.children.get(char)
+            if child is None:
+                child = TrieNode()
+                node.children[char] = child
+            node = child
+        node.is_end_of_word = True
+    return root
+
+
 def longest_common_prefix(words):
     """
     Find longest common prefix using Trie.
@@ -174,15 +415,7 @@ def longest_common_prefix(words):
     if not words:
         return ""
 
-    # Build trie
-    root = TrieNode()
-    for word in words:
-        node = root
-        for char in word:
-            if char not in node.children:
-                node.children[char] = TrieNode()
-            node = node.children[char]
-        node.is_end_of_word = True
+    root = _build_trie(words)
 
     # Find longest common prefix
     prefix = []
@@ -193,9 +426,8 @@ def longest_common_prefix(words):
         if len(node.children) != 1 or node.is_end_of_word:
             break
 
-        char = list(node.children.keys())[0]
+        (char, node), = node.children.items()
         prefix.append(char)
-        node = node.children[char]
 
     return ''.join(prefix)
 
@@ -212,15 +444,7 @@ def word_break(s, word_dict):
     Returns:
         bool: True if can be segmented
     """
-    # Build trie from dictionary
-    root = TrieNode()
-    for word in word_dict:
-        node = root
-        for char in word:
-            if char not in node.children:
-                node.children[char] = TrieNode()
-            node = node.children[char]
-        node.is_end_of_word = True
+    root = _build_trie(word_dict)
 
     n = len(s)
     dp = [False] * (n + 1)
@@ -232,15 +456,13 @@ def word_break(s, word_dict):
             if dp[j]:
                 # Check if s[j:i] is in trie
                 node = root
-                found = True
 
                 for k in range(j, i):
-                    if s[k] not in node.children:
-                        found = False
+                    node = node.children.get(s[k])
+                    if node is None:
                         break
-                    node = node.children[s[k]]
 
-                if found and node.is_end_of_word:
+                if node is not None and node.is_end_of_word:
                     dp[i] = True
                     break
 
@@ -258,15 +480,7 @@ def find_all_concatenated_words(words):
     Returns:
         List of concatenated words
     """
-    # Build trie
-    root = TrieNode()
-    for word in words:
-        node = root
-        for char in word:
-            if char not in node.children:
-                node.children[char] = TrieNode()
-            node = node.children[char]
-        node.is_end_of_word = True
+    root = _build_trie(words)
 
     def can_form(word, start, count):
         """Check if word[start:] can be formed."""
@@ -275,11 +489,10 @@ def find_all_concatenated_words(words):
 
         node = root
         for i in range(start, len(word)):
-            if word[i] not in node.children:
+            node = node.children.get(word[i])
+            if node is None:
                 return False
 
-            node = node.children[word[i]]
-
             if node.is_end_of_word:
                 if can_form(word, i + 1, count + 1):
                     return True
@@ -306,30 +519,24 @@ def replace_words(dictionary, sentence):
     Returns:
         Modified sentence
     """
-    # Build trie
-    root = TrieNode()
-    for word in dictionary:
-        node = root
-        for char in word:
-            if char not in node.children:
-                node.children[char] = TrieNode()
-            node = node.children[char]
-        node.is_end_of_word = True
-        node.word = word
+    root = _build_trie(dictionary)
+    words = sentence.split()
 
-    def find_root(word):
-        """Find shortest root for word."""
+    # Walk each word only until it leaves the trie or reaches a root,
+    # replacing it in place in the split list
+    for index, word in enumerate(words):
         node = root
+        depth = 0
         for char in word:
-            if char not in node.children:
-                return word
-            node = node.children[char]
+            node = node.children.get(char)
+            if node is None:
+                break
+            depth += 1
             if node.is_end_of_word:
-                return node.word
-        return word
+                words[index] = word[:depth]
+                break
 
-    words = sentence.split()
-    return ' '.join(find_root(word) for word in words)
+    return ' '.join(words)
 
 
 def max_xor_pair(nums):
@@ -354,9 +561,11 @@ def max_xor_pair(nums):
         node = root
         for i in range(31, -1, -1):
             bit = (num >> i) & 1
-            if bit not in node.children:
-                node.children[bit] = TrieNode()
-            node = node.children[bit]
+            child = node.children.get(bit)
+            if child is None:
+                child = TrieNode()
+                node.children[bit] = child
+            node = child
 
     max_xor = 0
 
@@ -370,9 +579,10 @@ def max_xor_pair(nums):
             # Try to go opposite bit for max XOR
             opposite = 1 - bit
 
-            if opposite in node.children:
+            child = node.children.get(opposite)
+            if child is not None:
                 current_xor |= (1 << i)
-                node = node.children[opposite]
+                node = child
             else:
                 node = node.children[bit]
 
@@ -398,6 +608,9 @@ if __name__ == "__main__":
     print(f"Suggestions for 'app': {autocomplete.get_suggestions('app')}")
     print(f"Suggestions for 'ban': {autocomplete.get_suggestions('ban')}")
 
+    compact = CompactAutocomplete(words)
+    print(f"Compact suggestions for 'app': {compact.get_suggestions('app')}")
+
     # Test wildcard dictionary
     print("\n--- Wildcard Dictionary ---")
     word_dict = WordDictionary()
@@ -1,3 +1,6 @@
+from collections import deque
+
+
 class Graph:
     """
     Graph data structure implementation using adjacency list.
@@ -123,19 +126,19 @@ class Graph:
         if start_vertex not in self.adjacency_list:
             return []
 
-        visited = set()
-        queue = [start_vertex]
+        visited = {start_vertex}
+        queue = deque([start_vertex])
         result = []
 
         while queue:
-            vertex = queue.pop(0)
-            if vertex not in visited:
-                visited.add(vertex)
-                result.append(vertex)
+            vertex = queue.popleft()
+            result.append(vertex)
 
-                for neighbor, _ in self.adjacency_list[vertex]:
-                    if neighbor not in visited:
-                        queue.append(neighbor)
+            for neighbor, _ in self.adjacency_list[vertex]:
+                # Mark on enqueue so each vertex is queued only once
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    queue.append(neighbor)
 
         return result
 
@@ -154,16 +157,21 @@ class Graph:
 
         visited = set()
         result = []
+        stack = [start_vertex]
+
+        while stack:
+            vertex = stack.pop()
+            if vertex in visited:
+                continue
 
-        def dfs_helper(vertex):
             visited.add(vertex)
             result.append(vertex)
 
-            for neighbor, _ in self.adjacency_list[vertex]:
+            # Push in reverse so neighbors are visited in adjacency order
+            for neighbor, _ in reversed(self.adjacency_list[vertex]):
                 if neighbor not in visited:
-                    dfs_helper(neighbor)
+                    stack.append(neighbor)
 
-        dfs_helper(start_vertex)
         return result
 
     def __str__(self):
@@ -1,3 +1,16 @@
+import heapq
+
+try:
+    from heapq import heappop_max, heappush_max
+except ImportError:  # Python < 3.14 only ships private max-heap helpers
+    from heapq import _heappop_max as heappop_max
+
+    def heappush_max(heap, item):
+        """Push item onto a max heap, maintaining the heap invariant."""
+        heap.append(item)
+        heapq._siftdown_max(heap, 0, len(heap) - 1)
+
+
 class MinHeap:
     """
     Min Heap implementation where the smallest element is at the root.
@@ -30,21 +43,7 @@ class MinHeap:
         Args:
             value: The value to insert
         """
-        self.heap.append(value)
-        self._heapify_up(len(self.heap) - 1)
-
-    def _heapify_up(self, index):
-        """
-        Move an element up the heap to maintain heap property.
-
-        Args:
-            index: The index to start heapifying from
-        """
-        parent_idx = self.parent(index)
-
-        if index > 0 and self.heap[index] < self.heap[parent_idx]:
-            self.swap(index, parent_idx)
-            self._heapify_up(parent_idx)
+        heapq.heappush(self.heap, value)
 
     def extract_min(self):
         """
@@ -59,35 +58,7 @@ class MinHeap:
         if len(self.heap) == 0:
             raise IndexError("Heap is empty")
 
-        if len(self.heap) == 1:
-            return self.heap.pop()
-
-        min_value = self.heap[0]
-        self.heap[0] = self.heap.pop()
-        self._heapify_down(0)
-
-        return min_value
-
-    def _heapify_down(self, index):
-        """
-        Move an element down the heap to maintain heap property.
-
-        Args:
-            index: The index to start heapifying from
-        """
-        smallest = index
-        left = self.left_child(index)
-        right = self.right_child(index)
-
-        if left < len(self.heap) and self.heap[left] < self.heap[smallest]:
-            smallest = left
-
-        if right < len(self.heap) and self.heap[right] < self.heap[smallest]:
-            smallest = right
-
-        if smallest != index:
-            self.swap(index, smallest)
-            self._heapify_down(smallest)
+        return heapq.heappop(self.heap)
 
     def peek(self):
         """
@@ -148,21 +119,7 @@ class MaxHeap:
         Args:
             value: The value to insert
         """
-        self.heap.append(value)
-        self._heapify_up(len(self.heap) - 1)
-
-    def _heapify_up(self, index):
-        """
-        Move an element up the heap to maintain heap property.
-
-        Args:
-            index: The index to start heapifying from
-        """
-        parent_idx = self.parent(index)
-
-        if index > 0 and self.heap[index] > self.heap[parent_idx]:
-            self.swap(index, parent_idx)
-            self._heapify_up(parent_idx)
+        heappush_max(self.heap, value)
 
     def extract_max(self):
         """
@@ -177,35 +134,7 @@ class MaxHeap:
         if len(self.heap) == 0:
             raise IndexError("Heap is empty")
 
-        if len(self.heap) == 1:
-            return self.heap.pop()
-
-        max_value = self.heap[0]
-        self.heap[0] = self.heap.pop()
-        self._heapify_down(0)
-
-        return max_value
-
-    def _heapify_down(self, index):
-        """
-        Move an element down the heap to maintain heap property.
-
-        Args:
-            index: The index to start heapifying from
-        """
-        largest = index
-        left = self.left_child(index)
-        right = self.right_child(index)
-
-        if left < len(self.heap) and self.heap[left] > self.heap[largest]:
-            largest = left
-
-        if right < len(self.heap) and self.heap[right] > self.heap[largest]:
-            largest = right
-
-        if largest != index:
-            self.swap(index, largest)
-            self._heapify_down(largest)
+        return heappop_max(self.heap)
 
     def peek(self):
         """
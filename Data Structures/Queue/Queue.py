@@ -1,12 +1,18 @@
+import heapq
+import itertools
+from array import array
+from collections import deque
+
+
 class Queue:
     """
-    Queue data structure implementation using a list.
+    Queue data structure implementation using a deque.
     Follows FIFO (First In First Out) principle.
     """
 
     def __init__(self):
         """Initialize an empty queue."""
-        self.items = []
+        self.items = deque()
 
     def enqueue(self, item):
         """
@@ -29,7 +35,7 @@ class Queue:
         """
         if self.is_empty():
             raise IndexError("Queue is empty")
-        return self.items.pop(0)
+        return self.items.popleft()
 
     def front(self):
         """
@@ -69,11 +75,11 @@ class Queue:
 
     def clear(self):
         """Remove all items from the queue."""
-        self.items = []
+        self.items.clear()
 
     def __str__(self):
         """String representation of the queue."""
-        return f"Queue({self.items})"
+        return f"Queue({list(self.items)})"
 
     def __len__(self):
         """Return the size of the queue."""
@@ -86,15 +92,27 @@ class CircularQueue:
     More efficient than regular queue for fixed-size buffers.
     """
 
-    def __init__(self, capacity):
+    def __init__(self, capacity, dtype=None):
         """
         Initialize a circular queue with fixed capacity.
 
         Args:
             capacity: Maximum number of items the queue can hold
+            dtype: Optional numeric array typecode (e.g. 'q', 'd'). If given,
+                items are stored packed in an array.array and must match it;
+                free slots hold 0 instead of None.
         """
         self.capacity = capacity
-        self.items = [None] * capacity
+        # The buffer length is rounded up to a power of two so indices wrap
+        # with a bitmask instead of a modulo; capacity still bounds the size
+        buffer_size = 1 << (max(capacity, 1) - 1).bit_length()
+        if dtype is None:
+            self._empty = None
+            self.items = [None] * buffer_size
+        else:
+            self._empty = 0
+            self.items = array(dtype, [0]) * buffer_size
+        self._mask = buffer_size - 1
         self.front_idx = 0
         self.rear_idx = -1
         self.current_size = 0
@@ -109,12 +127,14 @@ class CircularQueue:
         Raises:
             OverflowError: If queue is full
         """
-        if self.is_full():
+        size = self.current_size
+        if size == self.capacity:
             raise OverflowError("Queue is full")
 
-        self.rear_idx = (self.rear_idx + 1) % self.capacity
-        self.items[self.rear_idx] = item
-        self.current_size += 1
+        rear = (self.rear_idx + 1) & self._mask
+        self.items[rear] = item
+        self.rear_idx = rear
+        self.current_size = size + 1
 
     def dequeue(self):
         """
@@ -126,13 +146,16 @@ class CircularQueue:
         Raises:
             IndexError: If queue is empty
         """
-        if self.is_empty():
+        size = self.current_size
+        if size == 0:
             raise IndexError("Queue is empty")
 
-        item = self.items[self.front_idx]
-        self.items[self.front_idx] = None
-        self.front_idx = (self.front_idx + 1) % self.capacity
-        self.current_size -= 1
+        items = self.items
+        front = self.front_idx
+        item = items[front]
+        items[front] = self._empty
+        self.front_idx = (front + 1) & self._mask
+        self.current_size = size - 1
 
         return item
 
@@ -176,18 +199,29 @@ class CircularQueue:
         """Return the number of items in the queue."""
         return self.current_size
 
-    def __str__(self):
-        """String representation of the circular queue."""
+    def _two_slices(self):
+        """
+        Return the queued items as at most two contiguous buffer slices.
+
+        Returns:
+            tuple: Slices that, chained, run from front to rear
+        """
         if self.is_empty():
-            return "CircularQueue([])"
+            return ()
+
+        if self.rear_idx >= self.front_idx:
+            return (self.items[self.front_idx:self.rear_idx + 1],)
 
-        result = []
-        idx = self.front_idx
-        for _ in range(self.current_size):
-            result.append(self.items[idx])
-            idx = (idx + 1) % self.capacity
+        # Wrapped around: front run to the end, then the start up to rear
+        return (self.items[self.front_idx:], self.items[:self.rear_idx + 1])
 
-        return f"CircularQueue({result})"
+    def __iter__(self):
+        """Iterate over items from front to rear."""
+        return itertools.chain.from_iterable(self._two_slices())
+
+    def __str__(self):
+        """String representation of the circular queue."""
+        return f"CircularQueue({list(self)})"
 
     def __len__(self):
         """Return the size of the queue."""
@@ -202,7 +236,8 @@ class PriorityQueue:
 
     def __init__(self):
         """Initialize an empty priority queue."""
-        self.items = []
+        self.items = []  # Binary heap of (priority, insertion order, item)
+        self._counter = itertools.count()
 
     def enqueue(self, item, priority=0):
         """
@@ -212,8 +247,9 @@ class PriorityQueue:
             item: The item to add
             priority: Priority value (lower number = higher priority, default is 0)
         """
-        self.items.append((priority, item))
-        self.items.sort(key=lambda x: x[0])
+        # The insertion counter keeps equal priorities FIFO and means
+        # items themselves are never compared
+        heapq.heappush(self.items, (priority, next(self._counter), item))
 
     def dequeue(self):
         """
@@ -227,7 +263,7 @@ class PriorityQueue:
         """
         if self.is_empty():
             raise IndexError("Queue is empty")
-        return self.items.pop(0)[1]
+        return heapq.heappop(self.items)[2]
 
     def front(self):
         """
@@ -241,7 +277,7 @@ class PriorityQueue:
         """
         if self.is_empty():
             raise IndexError("Queue is empty")
-        return self.items[0][1]
+        return self.items[0][2]
 
     def is_empty(self):
         """Check if the queue is empty."""
@@ -253,11 +289,11 @@ class PriorityQueue:
 
     def clear(self):
         """Remove all items from the queue."""
-        self.items = []
+        self.items.clear()
 
     def __str__(self):
         """String representation of the priority queue."""
-        return f"PriorityQueue({[(item, priority) for priority, item in self.items]})"
+        return f"PriorityQueue({[(item, priority) for priority, _, item in sorted(self.items)]})"
 
     def __len__(self):
         """Return the size of the queue."""
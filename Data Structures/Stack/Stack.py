@@ -55,7 +55,7 @@ class Stack:
 
     def clear(self):
         """Remove all items from the stack."""
-        self.items = []
+        self.items.clear()
 
     def __str__(self):
         """String representation of the stack."""
@@ -74,7 +74,7 @@ class MinStack:
     def __init__(self):
         """Initialize an empty min stack."""
         self.stack = []
-        self.min_stack = []
+        self.min_stack = []  # [value, count] runs of the running minimum
 
     def push(self, item):
         """
@@ -85,8 +85,10 @@ class MinStack:
         """
         self.stack.append(item)
 
-        if not self.min_stack or item <= self.min_stack[-1]:
-            self.min_stack.append(item)
+        if not self.min_stack or item < self.min_stack[-1][0]:
+            self.min_stack.append([item, 1])
+        elif item == self.min_stack[-1][0]:
+            self.min_stack[-1][1] += 1
 
     def pop(self):
         """
@@ -103,8 +105,11 @@ class MinStack:
 
         item = self.stack.pop()
 
-        if item == self.min_stack[-1]:
-            self.min_stack.pop()
+        run = self.min_stack[-1]
+        if item == run[0]:
+            run[1] -= 1
+            if run[1] == 0:
+                self.min_stack.pop()
 
         return item
 
@@ -134,7 +139,7 @@ class MinStack:
         """
         if self.is_empty():
             raise IndexError("Stack is empty")
-        return self.min_stack[-1]
+        return self.min_stack[-1][0]
 
     def is_empty(self):
         """Check if the stack is empty."""
@@ -144,6 +149,11 @@ class MinStack:
         """Return the number of items in the stack."""
         return len(self.stack)
 
+    def clear(self):
+        """Remove all items from the stack."""
+        self.stack.clear()
+        self.min_stack.clear()
+
     def __str__(self):
         """String representation of the min stack."""
         return f"MinStack({self.stack})"
@@ -161,7 +171,7 @@ class MaxStack:
     def __init__(self):
         """Initialize an empty max stack."""
         self.stack = []
-        self.max_stack = []
+        self.max_stack = []  # [value, count] runs of the running maximum
 
     def push(self, item):
         """
@@ -172,8 +182,10 @@ class MaxStack:
         """
         self.stack.append(item)
 
-        if not self.max_stack or item >= self.max_stack[-1]:
-            self.max_stack.append(item)
+        if not self.max_stack or item > self.max_stack[-1][0]:
+            self.max_stack.append([item, 1])
+        elif item == self.max_stack[-1][0]:
+            self.max_stack[-1][1] += 1
 
     def pop(self):
         """
@@ -190,8 +202,11 @@ class MaxStack:
 
         item = self.stack.pop()
 
-        if item == self.max_stack[-1]:
-            self.max_stack.pop()
+        run = self.max_stack[-1]
+        if item == run[0]:
+            run[1] -= 1
+            if run[1] == 0:
+                self.max_stack.pop()
 
         return item
 
@@ -221,7 +236,7 @@ class MaxStack:
         """
         if self.is_empty():
             raise IndexError("Stack is empty")
-        return self.max_stack[-1]
+        return self.max_stack[-1][0]
 
     def is_empty(self):
         """Check if the stack is empty."""
@@ -231,6 +246,11 @@ class MaxStack:
         """Return the number of items in the stack."""
         return len(self.stack)
 
+    def clear(self):
+        """Remove all items from the stack."""
+        self.stack.clear()
+        self.max_stack.clear()
+
     def __str__(self):
         """String representation of the max stack."""
         return f"MaxStack({self.stack})"
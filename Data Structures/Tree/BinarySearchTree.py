@@ -1,3 +1,6 @@
+from array import array
+from collections import deque
+
 from Tree import BinaryTree, BinaryTreeNode
 
 
@@ -33,34 +36,68 @@ class BinarySearchTree(BinaryTree):
             self.root = BinaryTreeNode(data)
             return True
 
-        return self._insert_recursive(self.root, data)
-
-    def _insert_recursive(self, node, data):
+        node = self.root
+        while True:
+            key = node.data
+            if data == key:
+                # Duplicate value, typically not allowed in BST
+                return False
+            elif data < key:
+                left = node.left
+                if left is None:
+                    node.left = BinaryTreeNode(data)
+                    return True
+                node = left
+            else:  # data > key
+                right = node.right
+                if right is None:
+                    node.right = BinaryTreeNode(data)
+                    return True
+                node = right
+
+    def bulk_insert(self, values):
         """
-        Helper method to recursively insert data into the BST.
+        Insert many values at once.
+
+        On an empty tree the values are sorted once and the tree is built
+        balanced straight from the sorted run, with no per-value descent.
+        Otherwise values are inserted one at a time.
 
         Args:
-            node: Current node being examined
-            data: Data to insert
+            values: Iterable of values to insert
 
         Returns:
-            bool: True if inserted successfully, False if duplicate
+            int: Number of values inserted (duplicates are skipped)
         """
-        if data == node.data:
-            # Duplicate value, typically not allowed in BST
-            return False
-        elif data < node.data:
-            if node.left is None:
-                node.left = BinaryTreeNode(data)
-                return True
-            else:
-                return self._insert_recursive(node.left, data)
-        else:  # data > node.data
-            if node.right is None:
-                node.right = BinaryTreeNode(data)
-                return True
+        if self.root is not None:
+            return sum(self.insert(value) for value in values)
+
+        keys = []
+        for value in sorted(values):
+            if not keys or value != keys[-1]:
+                keys.append(value)
+
+        # The middle of each slice becomes the root of that subtree
+        stack = [(None, 0, len(keys) - 1, False)]
+        while stack:
+            parent, low, high, is_left = stack.pop()
+            if low > high:
+                continue
+
+            mid = (low + high) // 2
+            node = BinaryTreeNode(keys[mid])
+
+            if parent is None:
+                self.root = node
+            elif is_left:
+                parent.left = node
             else:
-                return self._insert_recursive(node.right, data)
+                parent.right = node
+
+            stack.append((node, low, mid - 1, True))
+            stack.append((node, mid + 1, high, False))
+
+        return len(keys)
 
     def search(self, data):
         """
@@ -72,26 +109,14 @@ class BinarySearchTree(BinaryTree):
         Returns:
             BinaryTreeNode: The node containing the data, or None if not found
         """
-        return self._search_recursive(self.root, data)
-
-    def _search_recursive(self, node, data):
-        """
-        Helper method to recursively search for data in the BST.
-
-        Args:
-            node: Current node being examined
-            data: Data to search for
-
-        Returns:
-            BinaryTreeNode: The node containing the data, or None if not found
-        """
-        if node is None or node.data == data:
-            return node
+        node = self.root
+        while node is not None:
+            key = node.data
+            if key == data:
+                return node
+            node = node.left if data < key else node.right
 
-        if data < node.data:
-            return self._search_recursive(node.left, data)
-        else:
-            return self._search_recursive(node.right, data)
+        return None
 
     def find_min(self, node=None):
         """
@@ -109,8 +134,10 @@ class BinarySearchTree(BinaryTree):
         if node is None:
             return None
 
-        while node.left is not None:
-            node = node.left
+        left = node.left
+        while left is not None:
+            node = left
+            left = node.left
 
         return node.data
 
@@ -130,8 +157,10 @@ class BinarySearchTree(BinaryTree):
         if node is None:
             return None
 
-        while node.right is not None:
-            node = node.right
+        right = node.right
+        while right is not None:
+            node = right
+            right = node.right
 
         return node.data
 
@@ -145,62 +174,56 @@ class BinarySearchTree(BinaryTree):
         Returns:
             bool: True if deleted successfully, False if not found
         """
-        self.root, deleted = self._delete_recursive(self.root, data)
-        return deleted
-
-    def _delete_recursive(self, node, data):
-        """
-        Helper method to recursively delete data from the BST.
-
-        Args:
-            node: Current node being examined
-            data: Data to delete
+        # Find the node to delete and its parent
+        parent = None
+        node = self.root
+        while node is not None:
+            key = node.data
+            if key == data:
+                break
+            parent = node
+            node = node.left if data < key else node.right
 
-        Returns:
-            tuple: (new subtree root, whether deletion was successful)
-        """
         if node is None:
-            return None, False
-
-        deleted = False
+            return False
 
-        if data < node.data:
-            node.left, deleted = self._delete_recursive(node.left, data)
-        elif data > node.data:
-            node.right, deleted = self._delete_recursive(node.right, data)
+        left, right = node.left, node.right
+
+        # Node has both children: copy up the inorder successor (minimum
+        # in right subtree), then unlink the successor node instead
+        if left is not None and right is not None:
+            successor_parent = node
+            successor = right
+            left = successor.left
+            while left is not None:
+                successor_parent = successor
+                successor = left
+                left = successor.left
+
+            node.data = successor.data
+            parent, node = successor_parent, successor
+            right = node.right
+
+        # Node now has at most one child, which takes its place
+        child = left if left is not None else right
+
+        if parent is None:
+            self.root = child
+        elif parent.left is node:
+            parent.left = child
         else:
-            # Found the node to delete
-            deleted = True
-
-            # Case 1: Node has no children (leaf node)
-            if node.left is None and node.right is None:
-                return None, deleted
-
-            # Case 2: Node has only right child
-            elif node.left is None:
-                return node.right, deleted
-
-            # Case 3: Node has only left child
-            elif node.right is None:
-                return node.left, deleted
+            parent.right = child
 
-            # Case 4: Node has both children
-            # Find the inorder successor (minimum in right subtree)
-            successor_data = self.find_min(node.right)
-            node.data = successor_data
-            # Delete the successor
-            node.right, _ = self._delete_recursive(node.right, successor_data)
+        return True
 
-        return node, deleted
-
-    def is_valid_bst(self, node=None, min_val=float('-inf'), max_val=float('inf')):
+    def is_valid_bst(self, node=None, min_val=None, max_val=None):
         """
         Check if the tree is a valid Binary Search Tree.
 
         Args:
             node: Starting node (defaults to root)
-            min_val: Minimum allowed value for this node
-            max_val: Maximum allowed value for this node
+            min_val: Exclusive lower bound for every value (None for no bound)
+            max_val: Exclusive upper bound for every value (None for no bound)
 
         Returns:
             bool: True if valid BST, False otherwise
@@ -211,13 +234,69 @@ class BinarySearchTree(BinaryTree):
         if node is None:
             return True
 
-        # Check if current node violates BST property
-        if node.data <= min_val or node.data >= max_val:
-            return False
+        # Inorder visits values in sorted order, so each value only has
+        # to be greater than the previous one
+        walk = self._morris_inorder(node)
+        try:
+            previous = next(walk).data
+            if min_val is not None and previous <= min_val:
+                return False
+
+            for current in walk:
+                data = current.data
+                if data <= previous:
+                    return False
+                previous = data
+
+            # previous is now the largest value
+            return max_val is None or previous < max_val
+        finally:
+            # Also runs on an early return or a failed comparison, and
+            # removes any temporary links still in the tree
+            walk.close()
+
+    def _morris_inorder(self, node):
+        """
+        Yield the nodes of node's subtree in inorder without a stack.
+
+        Morris traversal: each inorder predecessor's right link temporarily
+        points back at its successor. If the generator is closed early it
+        finishes the walk without yielding, so every temporary link is
+        removed and the tree is left unchanged.
 
-        # Recursively check left and right subtrees
-        return (self.is_valid_bst(node.left, min_val, node.data) and
-                self.is_valid_bst(node.right, node.data, max_val))
+        Args:
+            node: Root of the subtree to walk
+
+        Yields:
+            BinaryTreeNode: Nodes in inorder
+        """
+        closed = False
+
+        while node is not None:
+            left = node.left
+            if left is not None:
+                predecessor = left
+                right = predecessor.right
+                while right is not None and right is not node:
+                    predecessor = right
+                    right = predecessor.right
+
+                if right is None:
+                    # First visit: thread back to node, then go left
+                    predecessor.right = node
+                    node = left
+                    continue
+
+                # Second visit: left subtree is done, remove the thread
+                predecessor.right = None
+
+            if not closed:
+                try:
+                    yield node
+                except GeneratorExit:
+                    closed = True
+
+            node = node.right
 
     def find_successor(self, data):
         """
@@ -229,28 +308,26 @@ class BinarySearchTree(BinaryTree):
         Returns:
             The successor value, or None if not found or no successor exists
         """
-        node = self.search(data)
-        if node is None:
-            return None
-
-        # Case 1: Node has right subtree
-        if node.right is not None:
-            return self.find_min(node.right)
-
-        # Case 2: No right subtree, find ancestor
+        # Single descent, remembering the last ancestor where we went left
         successor = None
         current = self.root
 
         while current is not None:
-            if data < current.data:
-                successor = current.data
+            key = current.data
+            if data < key:
+                successor = key
                 current = current.left
-            elif data > current.data:
+            elif data > key:
                 current = current.right
             else:
-                break
+                # Case 1: Node has right subtree
+                if current.right is not None:
+                    return self.find_min(current.right)
+
+                # Case 2: No right subtree, successor is that ancestor
+                return successor
 
-        return successor
+        return None
 
     def find_predecessor(self, data):
         """
@@ -262,28 +339,26 @@ class BinarySearchTree(BinaryTree):
         Returns:
             The predecessor value, or None if not found or no predecessor exists
         """
-        node = self.search(data)
-        if node is None:
-            return None
-
-        # Case 1: Node has left subtree
-        if node.left is not None:
-            return self.find_max(node.left)
-
-        # Case 2: No left subtree, find ancestor
+        # Single descent, remembering the last ancestor where we went right
         predecessor = None
         current = self.root
 
         while current is not None:
-            if data > current.data:
-                predecessor = current.data
+            key = current.data
+            if data > key:
+                predecessor = key
                 current = current.right
-            elif data < current.data:
+            elif data < key:
                 current = current.left
             else:
-                break
+                # Case 1: Node has left subtree
+                if current.left is not None:
+                    return self.find_max(current.left)
+
+                # Case 2: No left subtree, predecessor is that ancestor
+                return predecessor
 
-        return predecessor
+        return None
 
     def range_query(self, min_val, max_val):
         """
@@ -297,37 +372,182 @@ class BinarySearchTree(BinaryTree):
             list: Sorted list of values in the range
         """
         result = []
-        self._range_query_recursive(self.root, min_val, max_val, result)
+        stack = deque()
+        low, high = min_val, max_val
+        node = self.root
+
+        # Inorder walk that skips subtrees entirely below low
+        while True:
+            while node is not None:
+                data = node.data
+                if data < low:
+                    node = node.right
+                else:
+                    stack.append(node)
+                    node = node.left if data > low else None
+
+            if not stack:
+                break
+
+            node = stack.pop()
+            data = node.data
+
+            # Inorder is sorted, so everything after this is out of range
+            if data > high:
+                break
+
+            result.append(data)
+            node = node.right
+
         return result
 
-    def _range_query_recursive(self, node, min_val, max_val, result):
+    def __contains__(self, data):
         """
-        Helper method to recursively find values in range.
+        Check if a value is in the BST using 'in' operator.
 
         Args:
-            node: Current node
-            min_val: Minimum value (inclusive)
-            max_val: Maximum value (inclusive)
-            result: List to store results
+            data: The value to check
+
+        Returns:
+            bool: True if value exists, False otherwise
         """
-        if node is None:
-            return
+        return self.search(data) is not None
+
+    def __str__(self):
+        """String representation of the BST."""
+        return f"BinarySearchTree with root: {self.root.data if self.root else None}"
+
+
+class ArrayBST:
+    """
+    Insert-only Binary Search Tree of integers stored as parallel arrays.
+
+    Node i holds keys[i] and child indices left[i] / right[i] (-1 = none),
+    so a descent reads packed machine words instead of chasing node objects.
+    """
+
+    def __init__(self):
+        """Initialize an empty array-backed BST."""
+        self.keys = array('q')
+        self.left = array('l')
+        self.right = array('l')
+        self.root = -1
+
+    def insert(self, key):
+        """
+        Insert an integer key maintaining the BST property.
+
+        Args:
+            key: The integer to insert
+
+        Returns:
+            bool: True if inserted successfully, False if duplicate
+
+        Raises:
+            TypeError: If key is not an integer
+            OverflowError: If key does not fit in a signed 64-bit integer
+        """
+        keys, left, right = self.keys, self.left, self.right
+
+        # Find the parent slot first, without modifying anything
+        parent = self.root
+        links = None
+        while parent != -1:
+            current = keys[parent]
+            if key == current:
+                return False
+            links = left if key < current else right
+            if links[parent] == -1:
+                break
+            parent = links[parent]
+
+        # Append the key before linking it in, so a key the array cannot
+        # hold raises before the parent points at a missing node
+        new = len(keys)
+        keys.append(key)
+        left.append(-1)
+        right.append(-1)
+
+        if links is None:
+            self.root = new
+        else:
+            links[parent] = new
+
+        return True
+
+    def search(self, key):
+        """
+        Search for a key in the BST.
+
+        Args:
+            key: The integer to search for
+
+        Returns:
+            int: Index of the node holding key, or -1 if not found
+        """
+        keys, left, right = self.keys, self.left, self.right
 
-        # If current node is greater than min, search left subtree
-        if node.data > min_val:
-            self._range_query_recursive(node.left, min_val, max_val, result)
+        i = self.root
+        while i != -1 and keys[i] != key:
+            i = left[i] if key < keys[i] else right[i]
 
-        # If current node is in range, add it
-        if min_val <= node.data <= max_val:
-            result.append(node.data)
+        return i
+
+    def find_min(self):
+        """Return the minimum key, or None if the tree is empty."""
+        if self.root == -1:
+            return None
 
-        # If current node is less than max, search right subtree
-        if node.data < max_val:
-            self._range_query_recursive(node.right, min_val, max_val, result)
+        i = self.root
+        while self.left[i] != -1:
+            i = self.left[i]
+
+        return self.keys[i]
+
+    def find_max(self):
+        """Return the maximum key, or None if the tree is empty."""
+        if self.root == -1:
+            return None
+
+        i = self.root
+        while self.right[i] != -1:
+            i = self.right[i]
+
+        return self.keys[i]
+
+    def inorder_traversal(self):
+        """
+        Traverse the tree inorder by walking node indices.
+
+        Returns:
+            list: Sorted list of keys
+        """
+        keys, left, right = self.keys, self.left, self.right
+        result = []
+        stack = []
+
+        i = self.root
+        while stack or i != -1:
+            while i != -1:
+                stack.append(i)
+                i = left[i]
+            i = stack.pop()
+            result.append(keys[i])
+            i = right[i]
+
+        return result
+
+    def __contains__(self, key):
+        """Check if a key is in the tree using 'in' operator."""
+        return self.search(key) != -1
+
+    def __len__(self):
+        """Return the number of keys in the tree."""
+        return len(self.keys)
 
     def __str__(self):
-        """String representation of the BST."""
-        return f"BinarySearchTree with root: {self.root.data if self.root else None}"
+        """String representation of the array-backed BST."""
+        return f"ArrayBST with root: {self.keys[self.root] if self.root != -1 else None}"
 
 
 # Example usage and testing
@@ -352,6 +572,7 @@ if __name__ == "__main__":
     # Test search
     print("\nSearching for 40:", "Found" if bst.search(40) else "Not found")
     print("Searching for 100:", "Found" if bst.search(100) else "Not found")
+    print("60 in bst?", 60 in bst)
 
     # Test min/max
     print("\nMinimum value:", bst.find_min())
@@ -367,6 +588,11 @@ if __name__ == "__main__":
     # Test range query
     print("\nValues in range [25, 65]:", bst.range_query(25, 65))
 
+    # Test bulk insert into an empty tree (built balanced)
+    bulk = BinarySearchTree()
+    print("\nBulk inserted:", bulk.bulk_insert([7, 3, 11, 1, 5, 9, 13, 3]))
+    print("Bulk level order traversal:", bulk.level_order_traversal())
+
     # Test delete
     print("\nDeleting 30...")
     bst.delete(30)
@@ -381,3 +607,11 @@ if __name__ == "__main__":
     print("\nTree height:", bst.height())
     print("Tree size:", bst.size())
     print("Is balanced?", bst.is_balanced())
+
+    # Test the array-backed BST
+    array_bst = ArrayBST()
+    for val in values:
+        array_bst.insert(val)
+    print(f"\n{array_bst}")
+    print("ArrayBST inorder traversal:", array_bst.inorder_traversal())
+    print("40 in ArrayBST?", 40 in array_bst)
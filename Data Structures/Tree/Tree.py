@@ -1,6 +1,11 @@
+from collections import deque
+
+
 class TreeNode:
     """Node class for general tree."""
 
+    __slots__ = ('data', 'children')
+
     def __init__(self, data):
         """
         Initialize a tree node with data.
@@ -27,7 +32,10 @@ class TreeNode:
         Args:
             child_node: The child node to remove
         """
-        self.children = [child for child in self.children if child != child_node]
+        try:
+            self.children.remove(child_node)
+        except ValueError:
+            pass  # Not a child of this node
 
 
 class Tree:
@@ -62,15 +70,17 @@ class Tree:
         if node is None:
             node = self.root
 
-        if node is None:
-            return result
-
-        result.append(node.data)
-        for child in node.children:
-            self.traverse_preorder(child, result)
+        if node is not None:
+            self._preorder(node, result.append)
 
         return result
 
+    def _preorder(self, node, append):
+        """Append node's subtree in preorder; node must not be None."""
+        append(node.data)
+        for child in node.children:
+            self._preorder(child, append)
+
     def traverse_postorder(self, node=None, result=None):
         """
         Traverse the tree in postorder (children, root).
@@ -88,15 +98,17 @@ class Tree:
         if node is None:
             node = self.root
 
-        if node is None:
-            return result
-
-        for child in node.children:
-            self.traverse_postorder(child, result)
+        if node is not None:
+            self._postorder(node, result.append)
 
-        result.append(node.data)
         return result
 
+    def _postorder(self, node, append):
+        """Append node's subtree in postorder; node must not be None."""
+        for child in node.children:
+            self._postorder(child, append)
+        append(node.data)
+
     def traverse_level_order(self):
         """
         Traverse the tree level by level (breadth-first).
@@ -108,10 +120,10 @@ class Tree:
             return []
 
         result = []
-        queue = [self.root]
+        queue = deque([self.root])
 
         while queue:
-            node = queue.pop(0)
+            node = queue.popleft()
             result.append(node.data)
             queue.extend(node.children)
 
@@ -130,14 +142,17 @@ class Tree:
         if node is None:
             node = self.root
 
-        if node is None or not node.children:
+        if node is None:
             return 0
 
-        max_height = 0
-        for child in node.children:
-            max_height = max(max_height, self.height(child))
+        return self._height(node)
 
-        return max_height + 1
+    def _height(self, node):
+        """Height of node's subtree in edges; node must not be None."""
+        children = node.children
+        if not children:
+            return 0
+        return 1 + max(map(self._height, children))
 
     def size(self, node=None):
         """
@@ -155,11 +170,11 @@ class Tree:
         if node is None:
             return 0
 
-        count = 1
-        for child in node.children:
-            count += self.size(child)
+        return self._size(node)
 
-        return count
+    def _size(self, node):
+        """Number of nodes in node's subtree; node must not be None."""
+        return 1 + sum(map(self._size, node.children))
 
     def __str__(self):
         """String representation of the tree."""
@@ -169,6 +184,8 @@ class Tree:
 class BinaryTreeNode:
     """Node class for binary tree."""
 
+    __slots__ = ('data', 'left', 'right')
+
     def __init__(self, data):
         """
         Initialize a binary tree node with data.
@@ -243,12 +260,19 @@ class BinaryTree:
         if node is None:
             node = self.root
 
-        if node is None:
-            return result
+        append = result.append
+        stack = deque()
+        push, pop = stack.append, stack.pop
 
-        self.inorder_traversal(node.left, result)
-        result.append(node.data)
-        self.inorder_traversal(node.right, result)
+        while stack or node is not None:
+            # Go down the left spine, then visit and move right
+            while node is not None:
+                push(node)
+                node = node.left
+
+            node = pop()
+            append(node.data)
+            node = node.right
 
         return result
 
@@ -272,9 +296,19 @@ class BinaryTree:
         if node is None:
             return result
 
-        result.append(node.data)
-        self.preorder_traversal(node.left, result)
-        self.preorder_traversal(node.right, result)
+        append = result.append
+        stack = deque([node])
+        push, pop = stack.append, stack.pop
+
+        while stack:
+            node = pop()
+            append(node.data)
+
+            # Push right first so the left subtree is visited first
+            if node.right is not None:
+                push(node.right)
+            if node.left is not None:
+                push(node.left)
 
         return result
 
@@ -298,10 +332,22 @@ class BinaryTree:
         if node is None:
             return result
 
-        self.postorder_traversal(node.left, result)
-        self.postorder_traversal(node.right, result)
-        result.append(node.data)
+        # Two-stack postorder: collect root, right, left, then reverse
+        visited = []
+        append = visited.append
+        stack = deque([node])
+        push, pop = stack.append, stack.pop
 
+        while stack:
+            node = pop()
+            append(node.data)
+
+            if node.left is not None:
+                push(node.left)
+            if node.right is not None:
+                push(node.right)
+
+        result.extend(reversed(visited))
         return result
 
     def level_order_traversal(self):
@@ -315,16 +361,17 @@ class BinaryTree:
             return []
 
         result = []
-        queue = [self.root]
+        queue = deque((self.root,))
+        popleft, enqueue, append = queue.popleft, queue.append, result.append
 
         while queue:
-            node = queue.pop(0)
-            result.append(node.data)
+            node = popleft()
+            append(node.data)
 
-            if node.left:
-                queue.append(node.left)
-            if node.right:
-                queue.append(node.right)
+            if node.left is not None:
+                enqueue(node.left)
+            if node.right is not None:
+                enqueue(node.right)
 
         return result
 
@@ -338,16 +385,7 @@ class BinaryTree:
         Returns:
             int: Height of the tree
         """
-        if node is None:
-            node = self.root
-
-        if node is None:
-            return 0
-
-        left_height = self.height(node.left)
-        right_height = self.height(node.right)
-
-        return max(left_height, right_height) + 1
+        return self.stats(node)[1]
 
     def size(self, node=None):
         """
@@ -359,13 +397,45 @@ class BinaryTree:
         Returns:
             int: Number of nodes
         """
+        return self.stats(node)[0]
+
+    def stats(self, node=None):
+        """
+        Compute the size and height of the tree in a single pass.
+
+        Args:
+            node: Starting node (defaults to root)
+
+        Returns:
+            tuple: (number of nodes, height)
+        """
         if node is None:
             node = self.root
 
         if node is None:
-            return 0
-
-        return 1 + self.size(node.left) + self.size(node.right)
+            return 0, 0
+
+        # Iterative DFS carrying each node's depth; the height is the
+        # deepest depth reached and the size is the number of pops
+        size = 0
+        height = 0
+        stack = [(node, 1)]
+        pop = stack.pop
+        push = stack.append
+
+        while stack:
+            node, depth = pop()
+            size += 1
+            if depth > height:
+                height = depth
+
+            depth += 1
+            if node.right is not None:
+                push((node.right, depth))
+            if node.left is not None:
+                push((node.left, depth))
+
+        return size, height
 
     def is_balanced(self, node=None):
         """
@@ -383,13 +453,31 @@ class BinaryTree:
         if node is None:
             return True
 
-        left_height = self.height(node.left)
-        right_height = self.height(node.right)
+        # Single postorder pass: each node's height comes from its
+        # children's, and the walk stops at the first imbalance
+        heights = {}
+        stack = [(node, False)]
+
+        while stack:
+            node, children_done = stack.pop()
+
+            if not children_done:
+                stack.append((node, True))
+                if node.right is not None:
+                    stack.append((node.right, False))
+                if node.left is not None:
+                    stack.append((node.left, False))
+                continue
+
+            left_height = heights.pop(node.left, 0)
+            right_height = heights.pop(node.right, 0)
+
+            if abs(left_height - right_height) > 1:
+                return False
 
-        if abs(left_height - right_height) > 1:
-            return False
+            heights[node] = max(left_height, right_height) + 1
 
-        return self.is_balanced(node.left) and self.is_balanced(node.right)
+        return True
 
     def __str__(self):
         """String representation of the tree."""
@@ -1,6 +1,13 @@
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+
+
 class TrieNode:
     """Node class for Trie."""
 
+    __slots__ = ("children", "is_end_of_word")
+
     def __init__(self):
         """Initialize a trie node."""
         self.children = {}
@@ -13,9 +20,24 @@ class Trie:
     Efficient for storing and searching strings with common prefixes.
     """
 
+    # Limits for the get_words_with_prefix cache: total words held across
+    # all cached prefixes, and prefixes remembered as requested once
+    _PREFIX_CACHE_WORDS = 65536
+    _PREFIX_SEEN_SIZE = 4096
+
     def __init__(self):
         """Initialize an empty trie."""
         self.root = TrieNode()
+        self._size = 0
+        self._reset_prefix_cache()
+
+    def _reset_prefix_cache(self):
+        """Empty the prefix cache; called whenever the word set changes."""
+        # prefix -> tuple of words, least recently used first
+        self._prefix_cache = OrderedDict()
+        self._prefix_cache_words = 0
+        # Prefixes requested once; a second request admits them to the cache
+        self._prefix_seen = set()
 
     def insert(self, word):
         """
@@ -31,7 +53,50 @@ class Trie:
                 node.children[char] = TrieNode()
             node = node.children[char]
 
-        node.is_end_of_word = True
+        if not node.is_end_of_word:
+            node.is_end_of_word = True
+            self._size += 1
+            self._reset_prefix_cache()
+
+    def extend(self, words):
+        """
+        Insert many words, sorting them first so neighbours share prefixes.
+
+        The nodes along the previous word's path are kept on a stack, so
+        each word only walks the characters past its common prefix with
+        the word before it instead of starting again from the root.
+
+        Args:
+            words: Iterable of words to insert
+        """
+        added = 0
+        prev = ""
+        nodes = [self.root]  # nodes[k] is the node reached by prev[:k]
+
+        for word in sorted(words):
+            limit = min(len(prev), len(word))
+            common = 0
+            while common < limit and prev[common] == word[common]:
+                common += 1
+
+            del nodes[common + 1:]
+            node = nodes[-1]
+
+            for char in word[common:]:
+                child = node.children.get(char)
+                if child is None:
+                    child = node.children[char] = TrieNode()
+                nodes.append(child)
+                node = child
+
+            if not node.is_end_of_word:
+                node.is_end_of_word = True
+                added += 1
+            prev = word
+
+        if added:
+            self._size += added
+            self._reset_prefix_cache()
 
     def search(self, word):
         """
@@ -52,6 +117,30 @@ class Trie:
 
         return node.is_end_of_word
 
+    def search_many(self, words):
+        """
+        Search for many complete words in one call.
+
+        Args:
+            words: Iterable of words to search for
+
+        Returns:
+            list: One bool per word, True if that word exists
+        """
+        root = self.root
+        results = []
+        add_result = results.append
+
+        for word in words:
+            node = root
+            for char in word:
+                node = node.children.get(char)
+                if node is None:
+                    break
+            add_result(node is not None and node.is_end_of_word)
+
+        return results
+
     def starts_with(self, prefix):
         """
         Check if any word in the trie starts with the given prefix.
@@ -81,28 +170,32 @@ class Trie:
         Returns:
             bool: True if word was deleted, False if word not found
         """
-        def _delete_helper(node, word, index):
-            if index == len(word):
-                if not node.is_end_of_word:
-                    return False
-
-                node.is_end_of_word = False
-                return len(node.children) == 0
+        # Walk down, remembering each (parent, char) edge on the path
+        path = []
+        node = self.root
 
-            char = word[index]
-            if char not in node.children:
+        for char in word:
+            child = node.children.get(char)
+            if child is None:
                 return False
+            path.append((node, char))
+            node = child
 
-            child_node = node.children[char]
-            should_delete_child = _delete_helper(child_node, word, index + 1)
+        if not node.is_end_of_word:
+            return False
 
-            if should_delete_child:
-                del node.children[char]
-                return len(node.children) == 0 and not node.is_end_of_word
+        node.is_end_of_word = False
+        self._size -= 1
+        self._reset_prefix_cache()
 
-            return False
+        # Walk back up, pruning nodes left with no words below them
+        for parent, char in reversed(path):
+            child = parent.children[char]
+            if child.children or child.is_end_of_word:
+                break
+            del parent.children[char]
 
-        return _delete_helper(self.root, word, 0)
+        return True
 
     def get_all_words(self):
         """
@@ -111,17 +204,7 @@ class Trie:
         Returns:
             list: List of all words in the trie
         """
-        words = []
-
-        def _traverse(node, prefix):
-            if node.is_end_of_word:
-                words.append(prefix)
-
-            for char, child_node in node.children.items():
-                _traverse(child_node, prefix + char)
-
-        _traverse(self.root, "")
-        return words
+        return self._collect_words(self.root, "")
 
     def get_words_with_prefix(self, prefix):
         """
@@ -133,25 +216,69 @@ class Trie:
         Returns:
             list: List of words with the given prefix
         """
+        cache = self._prefix_cache
+        cached = cache.get(prefix)
+        if cached is not None:
+            cache.move_to_end(prefix)
+            return list(cached)
+
         node = self.root
 
-        # Navigate to the end of the prefix
+        # Navigate to the end of the prefix; misses are not cached
         for char in prefix:
-            if char not in node.children:
+            node = node.children.get(char)
+            if node is None:
                 return []
-            node = node.children[char]
 
         # Collect all words from this point
+        words = self._collect_words(node, prefix)
+
+        # Only prefixes asked for twice are cached, so one-off queries
+        # cost a set insert rather than a copy. The empty prefix is the
+        # whole word set and is never cached.
+        seen = self._prefix_seen
+        if prefix not in seen:
+            if len(seen) >= self._PREFIX_SEEN_SIZE:
+                seen.clear()
+            seen.add(prefix)
+        elif prefix and len(words) <= self._PREFIX_CACHE_WORDS:
+            # Evict least recently used prefixes until the words fit
+            total = self._prefix_cache_words + len(words)
+            while total > self._PREFIX_CACHE_WORDS:
+                total -= len(cache.popitem(last=False)[1])
+            cache[prefix] = tuple(words)
+            self._prefix_cache_words = total
+
+        return words
+
+    def _collect_words(self, node, prefix):
+        """
+        Collect all words in the subtree rooted at node.
+
+        Args:
+            node (TrieNode): Node reached by prefix
+            prefix (str): Characters on the path to node
+
+        Returns:
+            list: Words in the subtree, in insertion order of the children
+        """
         words = []
+        path = list(prefix)
+        stack = [(node, len(path), "")]
+
+        # Iterative DFS over one shared character buffer: each entry cuts
+        # path back to its depth and appends its own character
+        while stack:
+            node, depth, char = stack.pop()
+            path[depth:] = char
 
-        def _traverse(node, current_word):
             if node.is_end_of_word:
-                words.append(current_word)
+                words.append("".join(path))
 
-            for char, child_node in node.children.items():
-                _traverse(child_node, current_word + char)
+            depth = len(path)
+            for char, child_node in reversed(node.children.items()):
+                stack.append((child_node, depth, char))
 
-        _traverse(node, prefix)
         return words
 
     def count_words(self):
@@ -161,18 +288,7 @@ class Trie:
         Returns:
             int: Number of words
         """
-        count = 0
-
-        def _count(node):
-            nonlocal count
-            if node.is_end_of_word:
-                count += 1
-
-            for child_node in node.children.values():
-                _count(child_node)
-
-        _count(self.root)
-        return count
+        return self._size
 
     def is_empty(self):
         """
@@ -181,11 +297,13 @@ class Trie:
         Returns:
             bool: True if empty, False otherwise
         """
-        return len(self.root.children) == 0
+        return self._size == 0
 
     def clear(self):
         """Clear all words from the trie."""
         self.root = TrieNode()
+        self._size = 0
+        self._reset_prefix_cache()
 
     def longest_common_prefix(self):
         """
@@ -195,14 +313,40 @@ class Trie:
             str: The longest common prefix
         """
         node = self.root
-        prefix = ""
+        parts = []
 
         while len(node.children) == 1 and not node.is_end_of_word:
-            char = list(node.children.keys())[0]
-            prefix += char
-            node = node.children[char]
+            (char, node), = node.children.items()
+            parts.append(char)
+
+        return "".join(parts)
+
+    def freeze(self):
+        """
+        Build a read-only, compact copy of the trie.
 
-        return prefix
+        Returns:
+            FrozenTrie: Snapshot of the current words
+        """
+        labels = ["\0"]  # Placeholder for the root, which has no edge label
+        first_child = array('l')
+        is_end = bytearray([self.root.is_end_of_word])
+
+        # Number nodes in BFS order with each node's children sorted, so
+        # every sibling group is one contiguous, sorted run of labels.
+        # The loop visits nodes appended to queue while it runs.
+        queue = [self.root]
+        for node in queue:
+            first_child.append(len(queue))
+            children = node.children
+            for char in sorted(children):
+                child = children[char]
+                labels.append(char)
+                is_end.append(child.is_end_of_word)
+                queue.append(child)
+        first_child.append(len(queue))
+
+        return FrozenTrie("".join(labels), first_child, is_end)
 
     def __contains__(self, word):
         """
@@ -220,3 +364,848 @@ class Trie:
         """String representation of the trie."""
         words = self.get_all_words()
         return f"Trie({len(words)} words: {words[:10]}{'...' if len(words) > 10 else ''})"
+
+
+class FrozenTrie:
+    """
+    Read-only trie stored as flat buffers, built by Trie.freeze().
+    Node i's edge label is labels[i] and its children are the nodes
+    first_child[i] up to first_child[i + 1], whose labels are sorted,
+    so each step is a binary search over one short slice of labels.
+    """
+
+    def __init__(self, labels, first_child, is_end):
+        """
+        Initialize a frozen trie from its flat buffers.
+
+        Args:
+            labels (str): Edge label of every node, root first
+            first_child (array): Start of each node's children, plus one end entry
+            is_end (bytearray): 1 where a node ends a word
+        """
+        self.labels = labels
+        self.first_child = first_child
+        self.is_end = is_end
+
+    def _find(self, word):
+        """
+        Walk the path spelled by word.
+
+        Args:
+            word (str): The characters to follow
+
+        Returns:
+            int: Node reached, or -1 if the path does not exist
+        """
+        labels, first_child = self.labels, self.first_child
+        node = 0
+
+        for char in word:
+            hi = first_child[node + 1]
+            node = bisect_left(labels, char, first_child[node], hi)
+            if node == hi or labels[node] != char:
+                return -1
+
+        return node
+
+    def search(self, word):
+        """
+        Search for a complete word in the trie.
+
+        Args:
+            word (str): The word to search for
+
+        Returns:
+            bool: True if word exists, False otherwise
+        """
+        node = self._find(word)
+        return node != -1 and self.is_end[node] == 1
+
+    __contains__ = search
+
+    def starts_with(self, prefix):
+        """
+        Check if any word in the trie starts with the given prefix.
+
+        Args:
+            prefix (str): The prefix to search for
+
+        Returns:
+            bool: True if prefix exists, False otherwise
+        """
+        return self._find(prefix) != -1
+
+    def get_words_with_prefix(self, prefix):
+        """
+        Get all words that start with the given prefix.
+
+        Args:
+            prefix (str): The prefix to search for
+
+        Returns:
+            list: Words with the given prefix, in sorted order
+        """
+        node = self._find(prefix)
+        if node == -1:
+            return []
+
+        labels, first_child, is_end = self.labels, self.first_child, self.is_end
+        words = []
+        path = list(prefix)
+        stack = [(node, len(path), "")]
+
+        while stack:
+            node, depth, char = stack.pop()
+            path[depth:] = char
+
+            if is_end[node]:
+                words.append("".join(path))
+
+            depth = len(path)
+            for child in range(first_child[node + 1] - 1, first_child[node] - 1, -1):
+                stack.append((child, depth, labels[child]))
+
+        return words
+
+    def get_all_words(self):
+        """
+        Get all words stored in the trie.
+
+        Returns:
+            list: List of all words, in sorted order
+        """
+        return self.get_words_with_prefix("")
+
+    def count_words(self):
+        """
+        Count the number of words in the trie.
+
+        Returns:
+            int: Number of words
+        """
+        return self.is_end.count(1)
+
+
+class TrieArena:
+    """
+    Trie stored as parallel arrays instead of one object per node.
+
+    Nodes are integer ids indexing the arrays: label[i] is the code point
+    on the edge into node i, first_child[i] / next_sibling[i] chain its
+    children (-1 = none) and is_end[i] marks the end of a word. One dict
+    maps (parent id, char) to child id for lookups. Node 0 is the root.
+
+    This is a memory layout, not a speedup: it takes roughly 30% less
+    memory than Trie, but every lookup step builds a (node, char) tuple
+    and probes the shared edge dict, so search is slower than Trie's.
+    The sibling chains are only walked by get_all_words.
+    """
+
+    def __init__(self):
+        """Initialize an empty trie arena holding only the root."""
+        self.first_child = array('l', [-1])
+        self.next_sibling = array('l', [-1])
+        self.label = array('L', [0])
+        self.is_end = bytearray(1)
+        self.edges = {}
+
+    def _find(self, word):
+        """
+        Walk the edges spelled by word.
+
+        Args:
+            word (str): The characters to follow
+
+        Returns:
+            int: Id of the node reached, or -1 if the path does not exist
+        """
+        edges = self.edges
+        node = 0
+
+        for char in word:
+            node = edges.get((node, char), -1)
+            if node == -1:
+                break
+
+        return node
+
+    def insert(self, word):
+        """
+        Insert a word into the trie.
+
+        Args:
+            word (str): The word to insert
+        """
+        self.insert_many((word,))
+
+    def search(self, word):
+        """
+        Search for a complete word in the trie.
+
+        Args:
+            word (str): The word to search for
+
+        Returns:
+            bool: True if word exists, False otherwise
+        """
+        node = self._find(word)
+        return node != -1 and self.is_end[node] == 1
+
+    __contains__ = search
+
+    def insert_many(self, words):
+        """
+        Insert many words in one call.
+
+        The arrays, the edge dict and their methods are bound to locals
+        once for the whole batch; insert() goes through here as well.
+
+        Args:
+            words: Iterable of words to insert
+        """
+        edges = self.edges
+        get_edge = edges.get
+        first_child, is_end = self.first_child, self.is_end
+        add_first_child = first_child.append
+        add_next_sibling = self.next_sibling.append
+        add_label = self.label.append
+        add_is_end = is_end.append
+
+        for word in words:
+            node = 0
+            for char in word:
+                child = get_edge((node, char))
+                if child is None:
+                    child = len(is_end)
+                    # New children go to the front of the parent's chain
+                    add_first_child(-1)
+                    add_next_sibling(first_child[node])
+                    add_label(ord(char))
+                    add_is_end(0)
+                    first_child[node] = child
+                    edges[(node, char)] = child
+                node = child
+
+            is_end[node] = 1
+
+    def search_many(self, words):
+        """
+        Search for many complete words in one call.
+
+        Args:
+            words: Iterable of words to search for
+
+        Returns:
+            list: One bool per word, True if that word exists
+        """
+        get_edge = self.edges.get
+        is_end = self.is_end
+        results = []
+        add_result = results.append
+
+        for word in words:
+            node = 0
+            for char in word:
+                node = get_edge((node, char), -1)
+                if node == -1:
+                    break
+            add_result(node != -1 and is_end[node] == 1)
+
+        return results
+
+    def starts_with(self, prefix):
+        """
+        Check if any word in the trie starts with the given prefix.
+
+        Args:
+            prefix (str): The prefix to search for
+
+        Returns:
+            bool: True if prefix exists, False otherwise
+        """
+        return self._find(prefix) != -1
+
+    def get_all_words(self):
+        """
+        Get all words stored in the trie.
+
+        Returns:
+            list: List of all words, in insertion order of the children
+        """
+        first_child, next_sibling = self.first_child, self.next_sibling
+        label, is_end = self.label, self.is_end
+
+        words = []
+        path = []
+        stack = [(0, 0)]
+
+        # Iterative DFS; each entry cuts path back to its parent's depth.
+        # Chains run newest child first, so pushing them in chain order
+        # pops the oldest child first.
+        while stack:
+            node, depth = stack.pop()
+            del path[depth:]
+            if node != 0:
+                path.append(chr(label[node]))
+
+            if is_end[node]:
+                words.append("".join(path))
+
+            depth = len(path)
+            child = first_child[node]
+            while child != -1:
+                stack.append((child, depth))
+                child = next_sibling[child]
+
+        return words
+
+    def count_words(self):
+        """
+        Count the number of words in the trie.
+
+        Returns:
+            int: Number of words
+        """
+        return self.is_end.count(1)
+
+
+def _codes(word):
+    """
+    Code points of word as an indexable sequence of ints.
+
+    ASCII words are encoded to bytes, which iterate as ints without an
+    ord() call per character.
+    """
+    return word.encode('ascii') if word.isascii() else list(map(ord, word))
+
+
+class ArrayTrieNode:
+    """Node class for ArrayTrie with one child slot per alphabet letter."""
+
+    __slots__ = ("children", "is_end_of_word")
+
+    def __init__(self, alphabet_size):
+        """
+        Initialize a node with all child slots empty.
+
+        Args:
+            alphabet_size (int): Number of child slots
+        """
+        self.children = [None] * alphabet_size
+        self.is_end_of_word = False
+
+
+class _SmallAlphabetTrie:
+    """
+    Shared base for tries over a small contiguous alphabet.
+    Subclasses choose the node layout by providing _new_node, _find,
+    insert and get_all_words.
+    """
+
+    def __init__(self, alphabet_size=26, base_ord=ord('a')):
+        """
+        Initialize an empty trie.
+
+        Args:
+            alphabet_size (int): Number of characters in the alphabet
+            base_ord (int): Code point of the first alphabet character
+        """
+        self.alphabet_size = alphabet_size
+        self.base_ord = base_ord
+        self.root = self._new_node()
+
+    def _alphabet_codes(self, word):
+        """
+        Code points of word, checked against the alphabet up front.
+
+        Args:
+            word (str): The word to convert
+
+        Returns:
+            Sequence of ints, or None if any character is outside the alphabet
+        """
+        codes = _codes(word)
+        base = self.base_ord
+        if codes and (min(codes) < base or max(codes) >= base + self.alphabet_size):
+            return None
+        return codes
+
+    def search(self, word):
+        """
+        Search for a complete word in the trie.
+
+        Args:
+            word (str): The word to search for
+
+        Returns:
+            bool: True if word exists, False otherwise
+        """
+        node = self._find(word)
+        return node is not None and node.is_end_of_word
+
+    __contains__ = search
+
+    def starts_with(self, prefix):
+        """
+        Check if any word in the trie starts with the given prefix.
+
+        Args:
+            prefix (str): The prefix to search for
+
+        Returns:
+            bool: True if prefix exists, False otherwise
+        """
+        return self._find(prefix) is not None
+
+
+class ArrayTrie(_SmallAlphabetTrie):
+    """
+    Trie over a small contiguous alphabet (lowercase letters by default).
+    Children live in a fixed-size list indexed by ord(char) - base_ord,
+    so lookups are a list index instead of a dict probe.
+    """
+
+    def _new_node(self):
+        """Create an empty node with one slot per alphabet letter."""
+        return ArrayTrieNode(self.alphabet_size)
+
+    def _find(self, word):
+        """
+        Walk the path spelled by word.
+
+        Args:
+            word (str): The characters to follow
+
+        Returns:
+            ArrayTrieNode: Node reached, or None if the path does not exist
+        """
+        codes = self._alphabet_codes(word)
+        if codes is None:
+            return None
+
+        base = self.base_ord
+        node = self.root
+
+        for code in codes:
+            node = node.children[code - base]
+            if node is None:
+                return None
+
+        return node
+
+    def insert(self, word):
+        """
+        Insert a word into the trie.
+
+        Args:
+            word (str): The word to insert
+
+        Raises:
+            ValueError: If word contains a character outside the alphabet
+        """
+        # Checked before creating any node, so a rejected word leaves
+        # the trie unchanged
+        codes = self._alphabet_codes(word)
+        if codes is None:
+            raise ValueError(f"Word {word!r} has a character outside the trie alphabet")
+
+        size, base = self.alphabet_size, self.base_ord
+        node = self.root
+
+        for code in codes:
+            index = code - base
+            child = node.children[index]
+            if child is None:
+                child = ArrayTrieNode(size)
+                node.children[index] = child
+            node = child
+
+        node.is_end_of_word = True
+
+    def get_all_words(self):
+        """
+        Get all words stored in the trie.
+
+        Returns:
+            list: List of all words, in alphabetical order
+        """
+        base = self.base_ord
+        words = []
+        path = []
+        stack = [(self.root, 0, "")]
+
+        while stack:
+            node, depth, char = stack.pop()
+            path[depth:] = char
+
+            if node.is_end_of_word:
+                words.append("".join(path))
+
+            depth = len(path)
+            for index in range(self.alphabet_size - 1, -1, -1):
+                child = node.children[index]
+                if child is not None:
+                    stack.append((child, depth, chr(base + index)))
+
+        return words
+
+
+class BitmaskTrieNode:
+    """Node class for BitmaskTrie: a child bitmask plus only the children present."""
+
+    __slots__ = ("child_mask", "children", "is_end_of_word")
+
+    def __init__(self):
+        """Initialize a node with no children."""
+        self.child_mask = 0   # Bit i set when the child for letter i exists
+        self.children = []    # Present children, in alphabet order
+        self.is_end_of_word = False
+
+
+class BitmaskTrie(_SmallAlphabetTrie):
+    """
+    Trie over a small contiguous alphabet using a HAMT-style node layout.
+    Each node keeps a bitmask of which letters have children and a list
+    holding just those children; a child's position in the list is the
+    number of set bits below its letter's bit.
+    """
+
+    def _new_node(self):
+        """Create an empty node with no children."""
+        return BitmaskTrieNode()
+
+    def _find(self, word):
+        """
+        Walk the path spelled by word.
+
+        Args:
+            word (str): The characters to follow
+
+        Returns:
+            BitmaskTrieNode: Node reached, or None if the path does not exist
+        """
+        codes = self._alphabet_codes(word)
+        if codes is None:
+            return None
+
+        base = self.base_ord
+        node = self.root
+
+        for code in codes:
+            bit = 1 << (code - base)
+            mask = node.child_mask
+            if not mask & bit:
+                return None
+            node = node.children[(mask & (bit - 1)).bit_count()]
+
+        return node
+
+    def insert(self, word):
+        """
+        Insert a word into the trie.
+
+        Args:
+            word (str): The word to insert
+
+        Raises:
+            ValueError: If word contains a character outside the alphabet
+        """
+        # Checked before creating any node, so a rejected word leaves
+        # the trie unchanged
+        codes = self._alphabet_codes(word)
+        if codes is None:
+            raise ValueError(f"Word {word!r} has a character outside the trie alphabet")
+
+        base = self.base_ord
+        node = self.root
+
+        for code in codes:
+            bit = 1 << (code - base)
+            mask = node.child_mask
+            position = (mask & (bit - 1)).bit_count()
+            if mask & bit:
+                node = node.children[position]
+            else:
+                child = BitmaskTrieNode()
+                node.children.insert(position, child)
+                node.child_mask = mask | bit
+                node = child
+
+        node.is_end_of_word = True
+
+    def get_all_words(self):
+        """
+        Get all words stored in the trie.
+
+        Returns:
+            list: List of all words, in alphabetical order
+        """
+        base = self.base_ord
+        words = []
+        path = []
+        stack = [(self.root, 0, "")]
+
+        while stack:
+            node, depth, char = stack.pop()
+            path[depth:] = char
+
+            if node.is_end_of_word:
+                words.append("".join(path))
+
+            # Push children from the highest set bit down so the lowest
+            # letter is popped first
+            depth = len(path)
+            mask = node.child_mask
+            position = len(node.children)
+            while mask:
+                index = mask.bit_length() - 1
+                position -= 1
+                stack.append((node.children[position], depth, chr(base + index)))
+                mask ^= 1 << index
+
+        return words
+
+
+class RadixTrieNode:
+    """Node class for RadixTrie; label is the text on the edge into it."""
+
+    __slots__ = ("label", "children", "is_end_of_word")
+
+    def __init__(self, label=""):
+        """
+        Initialize a radix trie node.
+
+        Args:
+            label (str): Edge label leading into this node
+        """
+        self.label = label
+        self.children = {}  # First character of child label -> child
+        self.is_end_of_word = False
+
+
+class RadixTrie:
+    """
+    Radix (PATRICIA) trie: chains of single-child nodes are collapsed into
+    one edge labelled with the whole substring, so a word costs one node
+    per branching point instead of one node per character.
+    """
+
+    def __init__(self):
+        """Initialize an empty radix trie."""
+        self.root = RadixTrieNode()
+
+    def insert(self, word):
+        """
+        Insert a word into the trie.
+
+        Args:
+            word (str): The word to insert
+        """
+        node = self.root
+        i = 0
+        n = len(word)
+
+        while i < n:
+            child = node.children.get(word[i])
+            if child is None:
+                leaf = RadixTrieNode(word[i:])
+                leaf.is_end_of_word = True
+                node.children[word[i]] = leaf
+                return
+
+            label = child.label
+            if word.startswith(label, i):
+                node = child
+                i += len(label)
+                continue
+
+            # Word diverges inside this edge: split it at the mismatch
+            k = 1
+            limit = min(len(label), n - i)
+            while k < limit and label[k] == word[i + k]:
+                k += 1
+
+            middle = RadixTrieNode(label[:k])
+            node.children[word[i]] = middle
+            child.label = label[k:]
+            middle.children[child.label[0]] = child
+
+            node = middle
+            i += k
+
+        node.is_end_of_word = True
+
+    def search(self, word):
+        """
+        Search for a complete word in the trie.
+
+        Args:
+            word (str): The word to search for
+
+        Returns:
+            bool: True if word exists, False otherwise
+        """
+        node = self.root
+        i = 0
+
+        while i < len(word):
+            node = node.children.get(word[i])
+            if node is None or not word.startswith(node.label, i):
+                return False
+            i += len(node.label)
+
+        return node.is_end_of_word
+
+    __contains__ = search
+
+    def starts_with(self, prefix):
+        """
+        Check if any word in the trie starts with the given prefix.
+
+        Args:
+            prefix (str): The prefix to search for
+
+        Returns:
+            bool: True if prefix exists, False otherwise
+        """
+        node = self.root
+        i = 0
+
+        while i < len(prefix):
+            node = node.children.get(prefix[i])
+            if node is None:
+                return False
+
+            label = node.label
+            if not prefix.startswith(label, i):
+                # The prefix may end partway along this edge
+                return label.startswith(prefix[i:])
+            i += len(label)
+
+        return True
+
+    def delete(self, word):
+        """
+        Delete a word from the trie, re-merging edges it no longer splits.
+
+        Args:
+            word (str): The word to delete
+
+        Returns:
+            bool: True if word was deleted, False if word not found
+        """
+        parent = None
+        node = self.root
+        i = 0
+
+        while i < len(word):
+            child = node.children.get(word[i])
+            if child is None or not word.startswith(child.label, i):
+                return False
+            parent, node = node, child
+            i += len(child.label)
+
+        if not node.is_end_of_word:
+            return False
+
+        node.is_end_of_word = False
+
+        if not node.children and parent is not None:
+            del parent.children[node.label[0]]
+            node = parent
+
+        # A non-root node with no word and one child is a plain edge again
+        if node is not self.root and not node.is_end_of_word and len(node.children) == 1:
+            (child,) = node.children.values()
+            node.label += child.label
+            node.children = child.children
+            node.is_end_of_word = child.is_end_of_word
+
+        return True
+
+    def get_all_words(self):
+        """
+        Get all words stored in the trie.
+
+        Returns:
+            list: List of all words in the trie
+        """
+        words = []
+        path = []
+        stack = [(self.root, 0)]
+
+        while stack:
+            node, depth = stack.pop()
+            path[depth:] = (node.label,)
+
+            if node.is_end_of_word:
+                words.append("".join(path))
+
+            depth = len(path)
+            for child in reversed(node.children.values()):
+                stack.append((child, depth))
+
+        return words
+
+    def count_words(self):
+        """
+        Count the number of words in the trie.
+
+        Returns:
+            int: Number of words
+        """
+        count = 0
+        stack = [self.root]
+
+        while stack:
+            node = stack.pop()
+            if node.is_end_of_word:
+                count += 1
+            stack.extend(node.children.values())
+
+        return count
+
+    def longest_common_prefix(self):
+        """
+        Find the longest common prefix among all words in the trie.
+
+        Returns:
+            str: The longest common prefix
+        """
+        parts = []
+        node = self.root
+
+        # Each step reads a whole edge label rather than one character
+        while len(node.children) == 1 and not node.is_end_of_word:
+            (node,) = node.children.values()
+            parts.append(node.label)
+
+        return "".join(parts)
+
+    def longest_prefix_of(self, text):
+        """
+        Find the longest stored word that is a prefix of text.
+
+        Each edge is matched with one str.startswith call, so the
+        comparison runs over the whole label at C speed.
+
+        Args:
+            text (str): The text to match against
+
+        Returns:
+            str or None: The longest matching word, or None if no word matches
+        """
+        node = self.root
+        i = 0
+        n = len(text)
+        best = 0 if node.is_end_of_word else -1
+
+        while i < n:
+            node = node.children.get(text[i])
+            if node is None or not text.startswith(node.label, i):
+                break
+            i += len(node.label)
+            if node.is_end_of_word:
+                best = i
+
+        return text[:best] if best != -1 else None